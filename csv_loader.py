@@ -230,7 +230,7 @@ def process_feature_file_v1(
     )
     feature_fields_count = len(feature_field_names)
 
-    feature_table_name = arcpy.ValidateTableName(feature_name, database_path)
+    feature_table_name = database_creator.valid_table_name(feature_name, database_path)
     feature_table = os.path.join(database_path, feature_table_name)
     feature_columns = (
         ["SHAPE@XY"]
@@ -8,12 +8,47 @@ Requires the Esri ArcGIS arcpy module.
 
 from __future__ import absolute_import, division, print_function, unicode_literals
 
+from collections import namedtuple
 from io import open
-import json
 import os
 
 import arcpy
 
+try:
+    # orjson (if installed) is much faster than the standard library's json
+    from orjson import loads as json_loads
+except ImportError:
+    from json import loads as json_loads
+
+# Cache for the default csv property (from csv.json); see get_default_csv()
+DEFAULT_CSV = None
+
+# Cache of validated table names; see valid_table_name()
+VALID_TABLE_NAMES = {}
+
+# Esri field type for each Park Observer attribute type (indexed by type // 100)
+TYPE_TABLE = (
+    "LONG",  # 0
+    "SHORT",  # 100
+    "LONG",  # 200
+    "DOUBLE",  # 300 - 64bit int (not supported by ESRI)
+    "DOUBLE",  # 400 - NSDecimal  (not supported by ESRI)
+    "DOUBLE",  # 500
+    "FLOAT",  # 600
+    "TEXT",  # 700
+    "SHORT",  # 800 - Boolean (use 0 = false, 1 = true)
+    "DATE",  # 900
+    "BLOB",  # 1000
+)
+
+# Park Observer attribute type for booleans; these get the YesNoBoolean domain.
+BOOLEAN_TYPE = 800
+
+# The parts of a protocol needed to build a database; see get_protocol_index_v1()
+ProtocolIndex = namedtuple(
+    "ProtocolIndex", "mission features domains aliases feature_tables"
+)
+
 
 def database_for_protocol_file(protocol_path, fgdb_folder):
     """Create an esri file geodatabase from a Park Observer protocol file.
@@ -23,8 +58,8 @@ def database_for_protocol_file(protocol_path, fgdb_folder):
 
     Returns the file path of the geodatabase (string) and the protocol (object).
     """
-    with open(protocol_path, "r", encoding="utf-8") as handle:
-        protocol = json.load(handle)
+    with open(protocol_path, "rb") as handle:
+        protocol = json_loads(handle.read())
     # I either crashed or I have a good protocol
     if protocol["meta-name"] == "NPS-Protocol-Specification":
         version = protocol["meta-version"]
@@ -45,19 +80,45 @@ def database_for_protocol_file(protocol_path, fgdb_folder):
 
 def add_missing_csv_section(protocol):
     """Add the default csv property to a protocol object and return the protocol."""
-    script_dir = os.path.dirname(os.path.realpath(__file__))
-    csv_path = os.path.join(script_dir, "csv.json")
-    with open(csv_path, "r", encoding="utf-8") as handle:
-        csv = json.load(handle)
-        protocol["csv"] = csv
+    protocol["csv"] = get_default_csv()
     return protocol
 
 
+def get_default_csv():
+    """Return the default csv property from csv.json.
+
+    The file is read once, and the result is reused by all later calls.
+    The returned object is shared, and should not be modified.
+    """
+    global DEFAULT_CSV  # pylint: disable=global-statement
+    if DEFAULT_CSV is None:
+        script_dir = os.path.dirname(os.path.realpath(__file__))
+        csv_path = os.path.join(script_dir, "csv.json")
+        with open(csv_path, "rb") as handle:
+            DEFAULT_CSV = json_loads(handle.read())
+    return DEFAULT_CSV
+
+
+def valid_table_name(name, workspace):
+    """Return arcpy.ValidateTableName(name, workspace).
+
+    The results are cached, since the same names are validated for every
+    survey loaded into a database.
+    """
+    key = (name, workspace)
+    try:
+        return VALID_TABLE_NAMES[key]
+    except KeyError:
+        valid_name = arcpy.ValidateTableName(name, workspace)
+        VALID_TABLE_NAMES[key] = valid_name
+        return valid_name
+
+
 def database_for_version1(protocol, workspace):
     """Create a geodatabase from a PO protocol file and return the fgdb's path."""
     version = int(protocol["version"])  # get just the major number of the protocol
     raw_database_name = "{0}_v{1}".format(protocol["name"], version)
-    valid_database_name = arcpy.ValidateTableName(raw_database_name, workspace) + ".gdb"
+    valid_database_name = valid_table_name(raw_database_name, workspace) + ".gdb"
     database = os.path.join(workspace, valid_database_name)
     if not arcpy.Exists(database):
         database = build_database_version1(protocol, workspace, valid_database_name)
@@ -70,29 +131,49 @@ def build_database_version1(protocol, folder, database):
     arcpy.CreateFileGDB_management(folder, database)
     fgdb = os.path.join(folder, database)
     spatial_ref = arcpy.SpatialReference(4326)
-    domains = get_domains_from_protocol_v1(protocol)
-    aliases = get_aliases_from_protocol_v1(protocol)
-    build_domains(fgdb, domains)
+    index = get_protocol_index_v1(protocol, fgdb)
+    build_domains(fgdb, index.domains)
     build_gpspoints_table_version1(fgdb, spatial_ref, protocol)
-    # mission is optional in Park Observer 2.0
-    try:
-        attribute_list = get_attributes(protocol["mission"], domains, aliases)
-    except KeyError:
+    if index.mission is None:
         attribute_list = []
+    else:
+        attribute_list = get_attributes(index.mission, index.domains, index.aliases)
     build_tracklog_table_version1(fgdb, spatial_ref, attribute_list, protocol)
     build_observations_table_version1(fgdb, spatial_ref, protocol)
-    for feature in protocol["features"]:
+    for feature in index.features:
         build_feature_table_version1(
             fgdb,
             spatial_ref,
-            feature["name"],
-            get_attributes(feature, domains, aliases),
+            index.feature_tables[feature["name"]],
+            get_attributes(feature, index.domains, index.aliases),
             protocol,
         )
-    build_relationships(fgdb, protocol)
+    build_relationships(fgdb, protocol, index)
     return fgdb
 
 
+def get_protocol_index_v1(protocol, fgdb):
+    """Return a ProtocolIndex with the parts of a protocol needed to build fgdb.
+
+    mission is the protocol's mission (object), or None if there is no mission
+    (it is optional in Park Observer 2.0).  features is the list of features
+    (objects).  domains and aliases are from get_domains_and_aliases_from_protocol_v1.
+    feature_tables is a dictionary of the validated table name in fgdb for
+    each feature name.
+
+    The index is built once, so the protocol is not walked again (and table
+    names are not validated again) for each step of building the database.
+    """
+    features = protocol["features"]
+    domains, aliases = get_domains_and_aliases_from_protocol_v1(protocol)
+    feature_tables = {
+        feature["name"]: valid_table_name(feature["name"], fgdb) for feature in features
+    }
+    return ProtocolIndex(
+        protocol.get("mission"), features, domains, aliases, feature_tables
+    )
+
+
 def get_attributes(feature, domains=None, aliases=None):
     """Converts a protocol feature's attributes into esri attribute properties.
 
@@ -101,62 +182,48 @@ def get_attributes(feature, domains=None, aliases=None):
 
     Return a list of esri attribute objects for each attribute in the feature.
     """
-    attribute_list = []
-    type_table = {
-        0: "LONG",
-        100: "SHORT",
-        200: "LONG",
-        300: "DOUBLE",  # 64bit int (not supported by ESRI)
-        400: "DOUBLE",  # NSDecimal  (not supported by ESRI)
-        500: "DOUBLE",
-        600: "FLOAT",
-        700: "TEXT",
-        800: "SHORT",  # Boolean (use 0 = false, 1 = true)
-        900: "DATE",
-        1000: "BLOB",
-    }
     # attributes are optional in Park Observer 2.0
     try:
         attributes = feature["attributes"]
     except KeyError:
         attributes = []
-    for attribute in attributes:
-        name = attribute["name"]
-        datatype = type_table[attribute["type"]]
-        try:
-            nullable = not attribute["required"]
-        except KeyError:
-            nullable = True
-
-        alias = name.replace("_", " ")
-        if aliases:
-            try:
-                feature_aliases = aliases[feature["name"]]
-            except KeyError:
-                try:
-                    feature_aliases = aliases["mission"]
-                except KeyError:
-                    feature_aliases = None
-            if feature_aliases and name in feature_aliases:
-                alias = feature_aliases[name]
-
-        if attribute["type"] == 800:
-            domain = "YesNoBoolean"
-        else:
-            if domains and name in domains:
-                domain = "{0}Codes".format(name)
-            else:
-                domain = ""
-
-        attribute_props = {
-            "name": name,
-            "nullable": nullable,
-            "type": datatype,
-            "alias": alias,
-            "domain": domain,
-        }
-        attribute_list.append(attribute_props)
-    return attribute_list
+    feature_aliases = {}
+    if aliases:
+        # mission is the only feature without a name
+        feature_aliases = aliases.get(feature.get("name"), aliases.get("mission")) or {}
+    return [
+        get_attribute_properties(attribute, feature_aliases, domains)
+        for attribute in attributes
+    ]
+
+
+def get_attribute_properties(attribute, feature_aliases, domains=None):
+    """Converts a protocol attribute into esri attribute properties.
+
+    Takes an attribute (object) from the protocol file, a dictionary of
+    aliases for the attribute's feature, and dictionary of domains (default None).
+
+    Return an esri attribute object (dictionary).
+    Raises ValueError if the attribute's type is not a Park Observer type.
+    """
+    name = attribute["name"]
+    attribute_type = attribute["type"]
+    if attribute_type % 100 or not 0 <= attribute_type <= 1000:
+        msg = "Attribute '{0}' has an unknown type: {1}"
+        raise ValueError(msg.format(name, attribute_type))
+    if attribute_type == BOOLEAN_TYPE:
+        domain = "YesNoBoolean"
+    elif domains and name in domains:
+        domain = name + "Codes"
+    else:
+        domain = ""
+    return {
+        "name": name,
+        "nullable": not attribute.get("required", False),
+        "type": TYPE_TABLE[attribute_type // 100],
+        "alias": feature_aliases.get(name, name.replace("_", " ")),
+        "domain": domain,
+    }
 
 
 def build_gpspoints_table_version1(fgdb, spatial_ref, protocol):
@@ -167,21 +234,13 @@ def build_gpspoints_table_version1(fgdb, spatial_ref, protocol):
     arcpy.CreateFeatureclass_management(
         fgdb, table_name, "POINT", "#", "#", "#", spatial_ref
     )
-    # doing multiple operations on a view is faster than on a table
-    view = arcpy.MakeTableView_management(os.path.join(fgdb, table_name), "view")
-    try:
-        # Protocol Attributes
-        #  - None
-        # Standard Attributes
-        for i, field_name in enumerate(field_names):
-            alias = field_name.replace("_", " ")
-            arcpy.AddField_management(
-                view, field_name, field_types[i], "", "", "", alias
-            )
-        # Links to related data
-        arcpy.AddField_management(view, "TrackLog_ID", "LONG")
-    finally:
-        arcpy.Delete_management(view)
+    # Protocol Attributes
+    #  - None
+    # Standard Attributes
+    fields = get_standard_fields(field_names, field_types)
+    # Links to related data
+    fields.append(["TrackLog_ID", "LONG"])
+    add_fields(os.path.join(fgdb, table_name), fields)
 
 
 def build_tracklog_table_version1(fgdb, spatial_ref, attributes, protocol):
@@ -192,32 +251,13 @@ def build_tracklog_table_version1(fgdb, spatial_ref, attributes, protocol):
     arcpy.CreateFeatureclass_management(
         fgdb, table_name, "POLYLINE", "#", "#", "#", spatial_ref
     )
-    view = arcpy.MakeTableView_management(os.path.join(fgdb, table_name), "view")
-    try:
-        # Protocol Attributes
-        for attribute in attributes:
-            arcpy.AddField_management(
-                view,
-                attribute["name"],
-                attribute["type"],
-                "",
-                "",
-                "",
-                attribute["alias"],
-                "",
-                "",
-                attribute["domain"],
-            )
-        # Standard Attributes
-        for i, field_name in enumerate(field_names):
-            alias = field_name.replace("_", " ")
-            arcpy.AddField_management(
-                view, field_name, field_types[i], "", "", "", alias
-            )
-            # Links to related data
-            #  - None
-    finally:
-        arcpy.Delete_management(view)
+    # Protocol Attributes
+    fields = get_protocol_fields(attributes)
+    # Standard Attributes
+    fields += get_standard_fields(field_names, field_types)
+    # Links to related data
+    #  - None
+    add_fields(os.path.join(fgdb, table_name), fields)
 
 
 def build_observations_table_version1(fgdb, spatial_ref, protocol):
@@ -228,63 +268,88 @@ def build_observations_table_version1(fgdb, spatial_ref, protocol):
     arcpy.CreateFeatureclass_management(
         fgdb, table_name, "POINT", "", "", "", spatial_ref
     )
-    view = arcpy.MakeTableView_management(os.path.join(fgdb, table_name), "view")
-    try:
-        # Protocol Attributes
-        #  - None
-        # Standard Attributes
-        for i, field_name in enumerate(field_names):
-            alias = field_name.replace("_", " ")
-            arcpy.AddField_management(
-                view, field_name, field_types[i], "", "", "", alias
-            )
-        # Link to related data
-        arcpy.AddField_management(view, "GpsPoint_ID", "LONG")
-    finally:
-        arcpy.Delete_management(view)
+    # Protocol Attributes
+    #  - None
+    # Standard Attributes
+    fields = get_standard_fields(field_names, field_types)
+    # Link to related data
+    fields.append(["GpsPoint_ID", "LONG"])
+    add_fields(os.path.join(fgdb, table_name), fields)
+
 
+def build_feature_table_version1(fgdb, spatial_ref, table_name, attributes, protocol):
+    """Create a feature class of PO observation items (features).
 
-def build_feature_table_version1(fgdb, spatial_ref, raw_name, attributes, protocol):
-    """Create a feature class of PO observation items (features)."""
-    valid_feature_name = arcpy.ValidateTableName(raw_name, fgdb)
+    table_name must be a valid table name for fgdb (see get_protocol_index_v1).
+    """
     field_names = protocol["csv"]["features"]["feature_field_names"]
     field_types = protocol["csv"]["features"]["feature_field_types"]
     arcpy.CreateFeatureclass_management(
-        fgdb, valid_feature_name, "POINT", "#", "#", "#", spatial_ref
-    )
-    view = arcpy.MakeTableView_management(
-        os.path.join(fgdb, valid_feature_name), "view"
+        fgdb, table_name, "POINT", "#", "#", "#", spatial_ref
     )
-    try:
-        # Protocol Attributes
-        for attribute in attributes:
-            arcpy.AddField_management(
-                view,
-                attribute["name"],
-                attribute["type"],
-                "",
-                "",
-                "",
-                attribute["alias"],
-                "",
-                "",
-                attribute["domain"],
-            )
-        # Standard Attributes
-        for i, field_name in enumerate(field_names):
-            alias = field_name.replace("_", " ")
-            arcpy.AddField_management(
-                view, field_name, field_types[i], "", "", "", alias
-            )
-        # Link to related data
-        arcpy.AddField_management(view, "GpsPoint_ID", "LONG")
-        arcpy.AddField_management(view, "Observation_ID", "LONG")
-    finally:
-        arcpy.Delete_management(view)
+    # Protocol Attributes
+    fields = get_protocol_fields(attributes)
+    # Standard Attributes
+    fields += get_standard_fields(field_names, field_types)
+    # Link to related data
+    fields.append(["GpsPoint_ID", "LONG"])
+    fields.append(["Observation_ID", "LONG"])
+    add_fields(os.path.join(fgdb, table_name), fields)
+
+
+def get_protocol_fields(attributes):
+    """Return a list of esri field descriptions for a list of esri attribute objects.
+
+    Each field description is a list of [name, type, alias, length, default, domain]
+    as expected by the AddFields geoprocessing tool.
+    """
+    return [
+        [
+            attribute["name"],
+            attribute["type"],
+            attribute["alias"],
+            "",
+            "",
+            attribute["domain"],
+        ]
+        for attribute in attributes
+    ]
+
+
+def get_standard_fields(field_names, field_types):
+    """Return a list of esri field descriptions for the standard (csv) attributes."""
+    return [
+        [field_name, field_type, field_name.replace("_", " ")]
+        for field_name, field_type in zip(field_names, field_types)
+    ]
+
+
+def add_fields(table, fields):
+    """Add a list of field descriptions to table.
+
+    Each field description is a list of [name, type, alias, length, default, domain];
+    trailing items are optional.  The fields are added with one AddFields
+    call (ArcGIS Pro), which is much faster than one AddField call per field.
+    If AddFields is not available (ArcGIS Desktop), fall back to AddField.
+    """
+    if not fields:
+        return
+    if hasattr(arcpy, "AddFields_management"):
+        arcpy.AddFields_management(table, fields)
+        return
+    for field in fields:
+        field = list(field) + [""] * (6 - len(field))
+        name, field_type, alias, length, _, domain = field
+        arcpy.AddField_management(
+            table, name, field_type, "", "", length, alias, "", "", domain
+        )
+
 
+def build_relationships(fgdb, protocol, index):
+    """Create the relationships between the various PO feature classes.
 
-def build_relationships(fgdb, protocol):
-    """Create the relationships between the various PO feature classes."""
+    index is the ProtocolIndex of protocol (see get_protocol_index_v1).
+    """
     gps_points_table = os.path.join(fgdb, protocol["csv"]["gps_points"]["name"])
     track_logs_table = os.path.join(fgdb, protocol["csv"]["track_logs"]["name"])
     observations_table = os.path.join(fgdb, "Observations")
@@ -316,8 +381,7 @@ def build_relationships(fgdb, protocol):
         "GpsPoint_ID",
     )
 
-    for feature_obj in protocol["features"]:
-        feature = arcpy.ValidateTableName(feature_obj["name"], fgdb)
+    for feature in index.feature_tables.values():
         feature_table = os.path.join(fgdb, feature)
         arcpy.CreateRelationshipClass_management(
             gps_points_table,
@@ -348,104 +412,103 @@ def build_relationships(fgdb, protocol):
 
 
 def build_domains(fgdb, domains):
-    """Create the esri domains (picklists) for track logs and features."""
-    arcpy.CreateDomain_management(
-        fgdb, "YesNoBoolean", "Yes/No values", "SHORT", "CODED"
-    )
-    arcpy.AddCodedValueToDomain_management(fgdb, "YesNoBoolean", 0, "No")
-    arcpy.AddCodedValueToDomain_management(fgdb, "YesNoBoolean", 1, "Yes")
+    """Create the esri domains (picklists) for track logs and features.
+
+    All the coded values are written to a staging table with one insert
+    cursor, and each domain is then created from that table with a single
+    TableToDomain call, instead of one AddCodedValueToDomain call per value.
+    """
+    domain_list = [("YesNoBoolean", "Yes/No values", ["No", "Yes"])]
     for domain in domains:
-        name = "{0}Codes".format(domain)
-        description = "Valid values for {0}".format(domain)
-        arcpy.CreateDomain_management(fgdb, name, description, "SHORT", "CODED")
-        items = domains[domain]
-        for i, item in enumerate(items):
-            arcpy.AddCodedValueToDomain_management(fgdb, name, i, item)
-
-
-def get_aliases_from_protocol_v1(protocol):
-    """Create esri field name aliases using the attribute titles from the  input form."""
-    # pylint: disable=too-many-nested-blocks
-    results = {}
+        name = domain + "Codes"
+        description = "Valid values for " + domain
+        domain_list.append((name, description, domains[domain]))
+    staging_table = os.path.join("in_memory", "domain_codes")
+    arcpy.CreateTable_management("in_memory", "domain_codes")
+    try:
+        arcpy.AddField_management(staging_table, "CODE", "SHORT")
+        arcpy.AddField_management(staging_table, "VALUE", "TEXT")
+        arcpy.AddField_management(staging_table, "DOMAIN", "TEXT")
+        with arcpy.da.InsertCursor(
+            staging_table, ["CODE", "VALUE", "DOMAIN"]
+        ) as cursor:
+            for name, _, items in domain_list:
+                for i, item in enumerate(items):
+                    cursor.insertRow((i, item, name))
+        for name, description, items in domain_list:
+            if not items:
+                arcpy.CreateDomain_management(fgdb, name, description, "SHORT", "CODED")
+                continue
+            where = "DOMAIN = '{0}'".format(name.replace("'", "''"))
+            view = arcpy.MakeTableView_management(staging_table, "domain_view", where)
+            try:
+                arcpy.TableToDomain_management(
+                    view, "CODE", "VALUE", fgdb, name, description, "REPLACE"
+                )
+            finally:
+                arcpy.Delete_management(view)
+    finally:
+        arcpy.Delete_management(staging_table)
+
+
+def get_domains_and_aliases_from_protocol_v1(protocol):
+    """Return the domains and aliases for the attributes in a protocol.
+
+    The domains are a dictionary of valid values (list) for each attribute
+    name (string).  The aliases are a dictionary of esri field name aliases
+    for each attribute name, for each feature name (the mission is called
+    "mission"); the aliases are built from the attribute titles in the input
+    form.  Both are collected in a single pass over the protocol.
+    """
+    # pylint: disable=too-many-nested-blocks,too-many-branches
+    domains = {}
+    aliases = {}
     # mission is optional in Park Observer 2.0
     try:
         mission_list = [protocol["mission"]]
     except KeyError:
         mission_list = []
     for feature in mission_list + protocol["features"]:
-        try:
-            feature_name = feature["name"]
-        except KeyError:
-            feature_name = "mission"
-        feature_results = {}
-        # dialog is optional in Park Observer 2.0
+        feature_name = feature.get("name", "mission")
+        feature_aliases = {}
+        # attributes, dialog and bind are optional properties in Park Observer 2.0
+        # Only the SHORT (100) attributes of a feature can have a domain
+        domain_names = frozenset(
+            attrib["name"]
+            for attrib in feature.get("attributes", [])
+            if attrib["type"] == 100
+        )
         if "dialog" in feature:
             for section in feature["dialog"]["sections"]:
-                try:
-                    section_title = section["title"]
-                except KeyError:
-                    section_title = None
+                section_title = section.get("title")
                 field_title = None
                 for field in section["elements"]:
-                    try:
-                        field_title = field["title"]
-                    except KeyError:
-                        pass
-                    try:
-                        field_name = field["bind"].split(":")[1]
-                    except (KeyError, IndexError, AttributeError):
+                    # Aliases
+                    # an element without a title uses the title of the prior element
+                    field_title = field.get("title", field_title)
+                    bind = field.get("bind")
+                    if bind and ":" in bind:
+                        field_name = bind.split(":", 2)[1]
+                    else:
                         field_name = None
                     if field_name and field_title:
                         if section_title:
-                            field_alias = "{0} {1}".format(section_title, field_title)
+                            field_alias = section_title + " " + field_title
                         else:
                             field_alias = field_title
-                        feature_results[field_name] = field_alias
-        results[feature_name] = feature_results
-    return results
-
-
-def get_domains_from_protocol_v1(protocol):
-    """Return a dictionary of valid values (list) for each attribute name (string)."""
-    # pylint: disable=too-many-nested-blocks,too-many-branches
-    results = {}
-    # mission, attributes, dialog and bind are optional properties in Park Observer 2.0
-    if "mission" in protocol:
-        if "attributes" in protocol["mission"]:
-            mission_attribute_names = [
-                attrib["name"]
-                for attrib in protocol["mission"]["attributes"]
-                if attrib["type"] == 100
-            ]
-            if "dialog" in protocol["mission"]:
-                for section in protocol["mission"]["dialog"]["sections"]:
-                    for field in section["elements"]:
-                        if "bind" in field:
-                            if field["type"] == "QRadioElement" and field[
-                                "bind"
-                            ].startswith("selected:"):
-                                name = field["bind"].replace("selected:", "").strip()
-                                if name in mission_attribute_names:
-                                    results[name] = field["items"]
-    for feature in protocol["features"]:
-        # attributes, dialog and bind are optional properties in Park Observer 2.0
-        if "attributes" in feature:
-            attribute_names = [
-                attrib["name"]
-                for attrib in feature["attributes"]
-                if attrib["type"] == 100
-            ]
-            if "dialog" in feature:
-                for section in feature["dialog"]["sections"]:
-                    for field in section["elements"]:
-                        if "bind" in field:
-                            if field["type"] == "QRadioElement" and field[
-                                "bind"
-                            ].startswith("selected:"):
-                                name = field["bind"].replace("selected:", "").strip()
-                                if name in attribute_names:
-                                    results[name] = field["items"]
-    return results
+                        feature_aliases[field_name] = field_alias
+                    # Domains
+                    if (
+                        domain_names
+                        and field.get("type") == "QRadioElement"
+                        and bind
+                        and bind.startswith("selected:")
+                    ):
+                        name = bind[9:].strip()  # 9 == len("selected:")
+                        if name in domain_names:
+                            domains[name] = field["items"]
+        aliases[feature_name] = feature_aliases
+    return domains, aliases
 
 
 if __name__ == "__main__":
@@ -17,19 +17,20 @@ import sys
 import tempfile
 import zipfile
 
-import csv_loader
-
 USAGE = "Usage: {0} FILE.poz\n"
 
 
 def process(archive):
     """Process the survey archive file."""
+    # Importing arcpy (via csv_loader) is slow, so it is not done until it is
+    # needed; this keeps the usage and file checks in main() fast.
+    import csv_loader  # pylint: disable=import-outside-toplevel
+
     extraction_folder = tempfile.mkdtemp()
     try:
         # unzip file
         with zipfile.ZipFile(archive) as my_zip:
-            for name in my_zip.namelist():
-                my_zip.extract(name, extraction_folder)
+            my_zip.extractall(extraction_folder)
         # get the protocol file
         protocol_path = os.path.join(extraction_folder, "protocol.obsprot")
         fgdb_folder = os.path.dirname(archive)
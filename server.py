@@ -4,25 +4,30 @@ A ReST service to support uploading of
 [Park Observer](https://github.com/AKROGIS/Park-Observer) survey archive
 to fie geodatabases on a server.
 
-Works with Python 2.7 and Python 3.x
+Requires Python 3.7+ (for ThreadingHTTPServer).
+Each request is handled in its own thread; uploads are processed in the
+order received by a single worker thread (see process_jobs).
 
 Requires the Esri ArcGIS arcpy module (via csv_loader).
 """
 
 from __future__ import absolute_import, division, print_function, unicode_literals
 
+import collections
 from io import open
+import json
 import os
+import queue
+import shutil
 import ssl
 import tempfile
+import threading
+import time
+import urllib.parse
+import uuid
 import zipfile
 
-try:
-    # Python 2
-    from BaseHTTPServer import BaseHTTPRequestHandler, HTTPServer
-except ImportError:
-    # python 3
-    from http.server import BaseHTTPRequestHandler, HTTPServer
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
 
 import csv_loader
 
@@ -50,28 +55,287 @@ class Config(object):
     # a secure service requires `import ssl`
     secure = True
 
+    # Largest upload (survey archive) accepted, in bytes.
+    max_upload_bytes = 2 << 30
+
+    # Most uploads waiting to be processed; more are refused (503) until one is done.
+    max_queued_jobs = 16
+
+
+# Number of bytes to read from the upload stream at a time.
+CHUNK_SIZE = 1 << 20
+
+# Templates for error messages; formatted with the fields from error_fields().
+ERROR_LOG_ENTRY = "{time}:{type} - {error}\n"
+TEMP_FILE_ERROR = "Unable to create/open temporary file on server:\n\t{type} - {error}"
+# Template for the response to an unknown request path; formatted with the command.
+UNKNOWN_COMMAND = "Unknown command request '{command}'\n"
+
+# Uploads waiting to be processed, as (job id, upload file object).
+# arcpy is not thread safe, so one worker thread processes the jobs in order;
+# see process_jobs().  Receiving uploads, and all GET requests are not serialized.
+JOB_QUEUE = queue.Queue()
+# A slot is taken before an upload is read, and given back when the worker starts
+# on it, so an overloaded server refuses (503) an upload without reading it.
+JOB_SLOTS = threading.BoundedSemaphore(Config.max_queued_jobs)
+
+# The status of the most recent MAX_JOBS jobs, by job id; see set_job_status().
+MAX_JOBS = 1000
+JOBS = collections.OrderedDict()
+JOBS_LOCK = threading.Lock()
+
+# Number of reusable folders for extracting uploads; see get_work_folder().
+# The worker uses one folder while the cleaner empties the last one used.
+WORK_FOLDER_COUNT = 2
+WORK_FOLDERS = queue.Queue(maxsize=WORK_FOLDER_COUNT)
+# Used work folders waiting to be emptied; see clean_work_folders().
+CLEANUP_QUEUE = queue.Queue()
+
 
 def utf8(text):
     """return unicode text as a utf-8 encoded byte string."""
     return text.encode("utf8")
 
 
+def copy_bytes(source, destination, length):
+    """Copy exactly length bytes from the source to the destination file object.
+
+    The bytes are read into one reusable buffer of CHUNK_SIZE bytes, so memory
+    use does not depend on length, and no new bytes object is made per chunk.
+    Raises OSError if source ends before length bytes are read.
+    """
+    buffer = memoryview(bytearray(min(length, CHUNK_SIZE)))
+    remaining = length
+    while remaining:
+        count = source.readinto(buffer[: min(remaining, len(buffer))])
+        if not count:
+            raise OSError("Upload ended before Content-Length")
+        destination.write(buffer[:count])
+        remaining -= count
+
+
+def extract_archive(archive, folder):
+    """Extract all the members of archive (a ZipFile) into folder.
+
+    Each member is streamed to disk in CHUNK_SIZE pieces, so a large member is
+    never entirely in memory.  Raises ValueError, before anything is extracted,
+    if any member has an absolute path or would be written outside of folder.
+
+    Members are extracted in the order they are stored in the archive (which is
+    not always the order of the zip's directory), so the archive is read
+    sequentially.
+    """
+    root = os.path.realpath(folder)
+    members = []
+    for info in sorted(archive.infolist(), key=lambda info: info.header_offset):
+        target = os.path.realpath(os.path.join(root, info.filename))
+        if info.filename.startswith(("/", "\\")) or not target.startswith(
+            root + os.sep
+        ):
+            raise ValueError("Invalid file name in archive: {0}".format(info.filename))
+        members.append((info, target))
+    for info, target in members:
+        if info.is_dir():
+            os.makedirs(target, exist_ok=True)
+            continue
+        os.makedirs(os.path.dirname(target), exist_ok=True)
+        with archive.open(info) as source, open(target, "wb") as destination:
+            shutil.copyfileobj(source, destination, CHUNK_SIZE)
+
+
+def parse_range(header, size):
+    """Return the (first, last) byte positions of a Range header for a file of size.
+
+    Supports a single range of the form "bytes=first-", "bytes=first-last", or
+    "bytes=-suffix_length" (e.g. "bytes=-1000" for the last 1000 bytes).
+    Returns None if there is no header, or it is not supported (the whole file
+    should be sent), and () if the range is not satisfiable (respond with 416).
+    """
+    if not header or not header.startswith("bytes=") or "," in header:
+        return None
+    first, sep, last = header[6:].strip().partition("-")
+    if not sep or not (first or last):
+        return None
+    try:
+        if first:
+            first = int(first)
+            last = int(last) if last else size - 1
+        else:
+            first = max(size - int(last), 0)
+            last = size - 1
+    except ValueError:
+        return None
+    if first > last and first < size:
+        return None
+    if first >= size or last < first:
+        return ()
+    return first, min(last, size - 1)
+
+
+def create_work_folders(parent):
+    """Create (or empty) the pool of WORK_FOLDER_COUNT work folders in parent.
+
+    A folder that cannot be created or emptied is logged and left out of the pool.
+    """
+    for i in range(WORK_FOLDER_COUNT):
+        folder = os.path.join(parent, "work{0}".format(i))
+        try:
+            os.makedirs(folder, exist_ok=True)
+            empty_folder(folder)
+        except OSError as ex:
+            log_error(ex)
+            continue
+        WORK_FOLDERS.put(folder)
+
+
+def get_work_folder(parent):
+    """Return an empty folder from the pool, or a new folder in parent if none are free.
+
+    Reusing the pooled folders saves creating (and deleting) a folder per upload.
+    The folder should be returned with release_work_folder().
+    """
+    try:
+        return WORK_FOLDERS.get_nowait()
+    except queue.Empty:
+        return tempfile.mkdtemp(dir=parent)
+
+
+def release_work_folder(folder):
+    """Empty folder and return it to the pool (or delete it if the pool is full)."""
+    empty_folder(folder)
+    try:
+        WORK_FOLDERS.put_nowait(folder)
+    except queue.Full:
+        shutil.rmtree(folder, ignore_errors=True)
+
+
+def empty_folder(folder):
+    """Delete the contents of folder."""
+    for entry in os.scandir(folder):
+        if entry.is_dir(follow_symlinks=False):
+            shutil.rmtree(entry.path, ignore_errors=True)
+        else:
+            os.remove(entry.path)
+
+
 # pylint: disable=broad-except,invalid-name
 
 
+def set_job_status(job_id, status, error=None):
+    """Record the status (and error message, if any) of a job.
+
+    Only the most recent MAX_JOBS jobs are remembered.
+    """
+    job = {"status": status}
+    if error is not None:
+        job["error"] = error
+    with JOBS_LOCK:
+        JOBS[job_id] = job
+        JOBS.move_to_end(job_id)
+        while len(JOBS) > MAX_JOBS:
+            JOBS.popitem(last=False)
+
+
+def error_fields(ex):
+    """Return the fields for formatting an error template for the exception ex."""
+    return {"type": type(ex).__name__, "error": ex}
+
+
+def log_time():
+    """Return the current time as text, as in the request log (not locale dependent)."""
+    year, month, day, hour, minute, second = time.localtime()[:6]
+    month_name = BaseHTTPRequestHandler.monthname[month]
+    return "{0:02d}/{1}/{2:04d} {3:02d}:{4:02d}:{5:02d}".format(
+        day, month_name, year, hour, minute, second
+    )
+
+
+def log_error(ex):
+    """Append the exception ex to the error log, and return the message logged."""
+    fields = error_fields(ex)
+    fields["time"] = log_time()
+    msg = ERROR_LOG_ENTRY.format_map(fields)
+    # Open the log for each (rare) error, so it can be deleted or rotated while
+    # the server is running.  With O_APPEND the message is added in one write.
+    file_desc = os.open(
+        SyncHandler.error_log, os.O_WRONLY | os.O_CREAT | os.O_APPEND, 0o644
+    )
+    try:
+        os.write(file_desc, utf8(msg))
+    finally:
+        os.close(file_desc)
+    return msg
+
+
+def process_jobs():
+    """Process the uploads in JOB_QUEUE, one at a time, forever.
+
+    This is the only thread that uses arcpy.
+    """
+    while True:
+        job_id, upload = JOB_QUEUE.get()
+        JOB_SLOTS.release()
+        set_job_status(job_id, "processing")
+        try:
+            csv_folder = get_work_folder(SyncHandler.upload_folder)
+            try:
+                SyncHandler.process(upload, csv_folder)
+            finally:
+                # Emptying the folder can take a while, so leave it to the cleaner.
+                CLEANUP_QUEUE.put(csv_folder)
+            set_job_status(job_id, "done")
+        except Exception as ex:
+            set_job_status(job_id, "failed", log_error(ex).strip())
+        finally:
+            upload.close()
+
+
+def clean_work_folders():
+    """Empty the used work folders on CLEANUP_QUEUE and return them to the pool.
+
+    Runs in its own thread, so the worker can start on the next upload.
+    """
+    while True:
+        folder = CLEANUP_QUEUE.get()
+        try:
+            release_work_folder(folder)
+        except Exception as ex:
+            log_error(ex)
+
+
 class SyncHandler(BaseHTTPRequestHandler):
     """A simple HTTP server."""
 
+    # Buffer the response (status line, headers and body) and send it with one
+    # write when the request is done, instead of one socket send per write().
+    wbufsize = -1
+    # Keep the connection open between requests (HTTP/1.1), so a client does not
+    # pay for a new TCP connection and TLS handshake on every request.  Every
+    # response must then send a Content-length.  Idle connections are closed
+    # after timeout seconds, so they do not tie up a thread forever.
+    protocol_version = "HTTP/1.1"
+    timeout = 60
+    # Length of an upload already accepted (and given a JOB_SLOTS slot) when the
+    # client asked to "Expect: 100-continue"; see handle_expect_100().
+    reserved_length = None
+
     upload_folder = os.path.join(Config.root_folder, Config.upload_folder_name)
     error_log = os.path.join(Config.root_folder, Config.error_log_name)
-    usage = (
-        "Usage:\n"
-        + "\tPOST with /sync with a zip containing the protocol and CSV files\n"
-        + "\tGET with /dir to list the databases\n"
-        + "\tGET with /load to show a form to upload a zip file\n"
-        + "\tGET with /error to list the error log file\n"
-        + "\tGET with /help for this message\n"
+    usage = "\n".join(
+        (
+            "Usage:",
+            "\tPOST with /sync with a zip containing the protocol and CSV files",
+            "\t\t(responds with the job id of the upload)",
+            "\tGET with /status?job=ID to check on an uploaded zip file",
+            "\tGET with /dir to list the databases",
+            "\tGET with /load to show a form to upload a zip file",
+            "\tGET with /error to list the error log file",
+            "\tGET with /help for this message",
+            "",
+        )
     )
+    # (modification time of the root folder, /dir response); see database_list()
+    dir_cache = (None, b"")
     form_body = """
         <html><body>
           <form enctype="multipart/form-data" method="post" action="sync">
@@ -80,97 +344,234 @@ class SyncHandler(BaseHTTPRequestHandler):
           </form>
         </body></html>
     """
+    # The fixed responses, encoded once instead of on every request.
+    banner = utf8("{0}\n".format(Config.name))
+    usage_bytes = utf8(usage)
+    form_bytes = utf8(form_body)
+    form_length = str(len(form_bytes))
 
     def do_GET(self):
         """Handle a GET request."""
         if self.path == "/error":
-            self.std_response()
-            if os.path.exists(self.error_log):
-                self.wfile.write(utf8("Error Log contents:\n"))
-                with open(self.error_log, "rb") as handle:
-                    self.wfile.write(handle.read())
-            else:
-                self.wfile.write(utf8("There are no errors to report."))
+            try:
+                handle = open(self.error_log, "rb")
+            except FileNotFoundError:
+                self.std_response(utf8("There are no errors to report."))
+                return
+            with handle:
+                size = os.fstat(handle.fileno()).st_size
+                byte_range = parse_range(self.headers.get("Range"), size)
+                if byte_range is not None:
+                    if not byte_range:
+                        self.send_response(416)
+                        self.send_header("Content-Range", "bytes */{0}".format(size))
+                        self.send_header("Content-length", 0)
+                        self.end_headers()
+                        return
+                    # Just the requested part of the log file, without the heading
+                    start, end = byte_range
+                    self.send_response(206)
+                    self.send_header("Content-type", "text")
+                    self.send_header(
+                        "Content-Range", "bytes {0}-{1}/{2}".format(start, end, size)
+                    )
+                    self.send_header("Content-length", end - start + 1)
+                    self.end_headers()
+                    self.send_file(handle, start, end - start + 1)
+                elif size:
+                    heading = self.banner + utf8("Error Log contents:\n")
+                    self.send_response(200)
+                    self.send_header("Content-type", "text")
+                    self.send_header("Content-length", len(heading) + size)
+                    self.end_headers()
+                    self.wfile.write(heading)
+                    self.send_file(handle, 0, size)
+                else:
+                    self.std_response(utf8("There are no errors to report."))
         elif self.path == "/dir":
-            self.std_response()
-            self.wfile.write(utf8("Databases:\n"))
-            for filename in os.listdir(Config.root_folder):
-                if filename not in ("upload", "error.log"):
-                    self.wfile.write(utf8("\t{0}\n".format(filename)))
+            self.std_response(self.database_list())
         elif self.path == "/help":
-            self.std_response()
-            self.wfile.write(utf8(self.usage))
+            self.std_response(self.usage_bytes)
+        elif self.path.startswith("/status?"):
+            query = urllib.parse.parse_qs(urllib.parse.urlsplit(self.path).query)
+            job_id = query.get("job", [""])[0]
+            with JOBS_LOCK:
+                status = JOBS.get(job_id)
+            if status is None:
+                self.json_response(404, {"job": job_id, "status": "unknown"})
+            else:
+                self.json_response(200, dict(status, job=job_id))
         elif self.path == "/load":
-            data = utf8(self.form_body)
             self.send_response(200)
             self.send_header("Content-type", "text/html")
-            self.send_header("Content-length", len(data))
+            self.send_header("Content-length", self.form_length)
             self.end_headers()
-            self.wfile.write(data)
+            self.wfile.write(self.form_bytes)
         else:
-            self.std_response()
-            msg = "Unknown command request '{0}'\n"
-            self.wfile.write(utf8(msg.format(self.path[1:])))
-            self.wfile.write(utf8(self.usage))
-
-    def std_response(self):
-        """Respond with simple text."""
-
+            msg = UNKNOWN_COMMAND.format(command=self.path[1:])
+            self.std_response(utf8(msg), self.usage_bytes)
+
+    @classmethod
+    def database_list(cls):
+        """Return the /dir response listing the databases (bytes).
+
+        The response is cached until the root folder's modification time changes.
+        """
+        mtime = os.stat(Config.root_folder).st_mtime_ns
+        cached_mtime, response = cls.dir_cache
+        if mtime != cached_mtime:
+            lines = ["Databases:\n"]
+            with os.scandir(Config.root_folder) as entries:
+                for entry in entries:
+                    if entry.name not in ("upload", "error.log"):
+                        lines.append("\t{0}\n".format(entry.name))
+            response = utf8("".join(lines))
+            cls.dir_cache = (mtime, response)
+        return response
+
+    def send_file(self, handle, offset, count):
+        """Send count bytes from offset in handle (a binary file) to the client."""
+
+        # socket.sendfile uses os.sendfile (zero-copy) where it can,
+        # and falls back to sending the file in chunks (Windows, TLS).
+        # It bypasses wfile, so send the buffered output first.
+        self.wfile.flush()
+        self.connection.sendfile(handle, offset, count)
+
+    def std_response(self, *parts):
+        """Respond with simple text; the banner followed by parts (bytes)."""
+
+        body = b"".join((self.banner,) + parts)
         self.send_response(200)
         self.send_header("Content-type", "text")
+        self.send_header("Content-length", len(body))
         self.end_headers()
-        self.wfile.write(utf8("{0}\n".format(Config.name)))
+        self.wfile.write(body)
 
-    def err_response(self):
-        """Respond with an error code and text."""
+    def json_response(self, code, data):
+        """Respond with an HTTP status code and data (a JSON serializable object)."""
 
-        self.send_response(500)
+        body = utf8(json.dumps(data))
+        self.send_response(code)
+        self.send_header("Content-type", "application/json")
+        self.send_header("Content-length", len(body))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def err_response(self, text, code=500):
+        """Respond with an error code (default 500) and text."""
+
+        # The request body may not have been read (or read completely), so the
+        # connection cannot be reused for another request.
+        self.close_connection = True
+        body = utf8(text)
+        self.send_response(code)
         self.send_header("Content-type", "text")
+        self.send_header("Content-length", len(body))
+        self.send_header("Connection", "close")
         self.end_headers()
+        self.wfile.write(body)
 
     def do_POST(self):
         """Handle a POST request."""
 
         if self.path == "/sync":
+            length = self.reserved_length
+            self.reserved_length = None
+            if length is None:
+                length = self.reserve_upload()
+                if length is None:
+                    return
             try:
-                length = self.headers.getheader("content-length")
-                data = self.rfile.read(int(length))
-                file_desc, file_name = tempfile.mkstemp(dir=self.upload_folder)
-                try:
-                    with open(file_name, "wb") as handle:
-                        # save (write) the binary upload (zip file) to a temp file
-                        handle.write(data)
-                    csv_folder = tempfile.mkdtemp(dir=self.upload_folder)
-                    try:
-                        self.process(file_name, csv_folder)
-                    finally:
-                        pass  # shutil.rmtree(csv_folder) # requires import shutil
-                    self.std_response()
-                    self.wfile.write(utf8("\tSuccessfully applied the uploaded file"))
-                except Exception as ex:
-                    self.err_response()
-                    msg = "{0}:{1} - {2}\n".format(
-                        self.log_date_time_string(), type(ex).__name__, ex
-                    )
-                    self.wfile.write(utf8(msg))
-                    with open(self.error_log, "a", encoding="utf-8") as handle:
-                        handle.write(msg)
-                finally:
-                    os.close(file_desc)
-                    # os.remove(file_name)
+                # The upload (zip file) is saved to a temp file, which is deleted
+                # when it is closed, so waiting uploads do not use memory.
+                # The worker thread closes the upload when it is done with it.
+                upload = tempfile.TemporaryFile(dir=self.upload_folder)
             except Exception as ex:
-                self.err_response()
-                msg = "Unable to create/open temporary file on server:\n\t{0} - {1}"
-                self.wfile.write(utf8(msg.format(type(ex).__name__, ex)))
+                JOB_SLOTS.release()
+                self.err_response(TEMP_FILE_ERROR.format_map(error_fields(ex)))
+                return
+            try:
+                # save (write) the binary upload in chunks, so a large
+                # upload is never entirely in memory.
+                copy_bytes(self.rfile, upload, length)
+                upload.seek(0)
+                job_id = uuid.uuid4().hex
+                set_job_status(job_id, "queued")
+                JOB_QUEUE.put((job_id, upload))
+            except Exception as ex:
+                upload.close()
+                JOB_SLOTS.release()
+                self.err_response(log_error(ex))
+                return
+            self.json_response(202, {"job": job_id, "status": "queued"})
+        else:
+            self.err_response(UNKNOWN_COMMAND.format(command=self.path[1:]), 404)
+
+    def handle_expect_100(self):
+        """Reply to "Expect: 100-continue" before the client sends the body.
+
+        An upload to /sync is checked (and given a job slot) first, so a client
+        is not told to continue with an upload that will be refused.
+        """
+        if self.command == "POST" and self.path == "/sync":
+            self.reserved_length = self.reserve_upload()
+            if self.reserved_length is None:
+                return False
+        self.send_response_only(100)
+        self.end_headers()
+        # The response is buffered (see wbufsize), so send it now.
+        self.wfile.flush()
+        return True
+
+    def reserve_upload(self):
+        """Return the length of the upload in bytes (integer), and take a job slot.
+
+        Returns None, after sending an error response, if the length is not
+        acceptable (see upload_length()) or there are no free job slots.
+        The slot must be given back (JOB_SLOTS.release()) if the upload fails.
+        """
+        length = self.upload_length()
+        if length is None:
+            return None
+        if not JOB_SLOTS.acquire(blocking=False):
+            self.err_response("Too many uploads waiting; try again later", 503)
+            return None
+        return length
+
+    def upload_length(self):
+        """Return the length of the upload in bytes (integer).
+
+        Returns None, after sending an error response, if the length is missing,
+        invalid, or larger than Config.max_upload_bytes.
+        """
+        length = self.headers.get("Content-Length")
+        if length is None:
+            self.err_response("Content-Length is required", 411)
+            return None
+        try:
+            length = int(length)
+        except ValueError:
+            length = -1
+        if length < 0:
+            self.err_response("Invalid Content-Length", 400)
+            return None
+        if length > Config.max_upload_bytes:
+            msg = "Upload is larger than the limit of {0} bytes"
+            self.err_response(msg.format(Config.max_upload_bytes), 413)
+            return None
+        return length
 
     @staticmethod
-    def process(filename, csv_folder):
-        """Unzip and create a FGDB from filename (a survey archive)."""
+    def process(archive, csv_folder):
+        """Unzip and create a FGDB from archive (a survey archive).
+
+        archive is a path or a (seekable) binary file object.
+        """
 
         # unzip file
-        with zipfile.ZipFile(filename) as my_zip:
-            for name in my_zip.namelist():
-                my_zip.extract(name, csv_folder)
+        with zipfile.ZipFile(archive) as my_zip:
+            extract_archive(my_zip, csv_folder)
         # get the protocol file
         protocol_path = os.path.join(csv_folder, "protocol.obsprot")
         db_builder = csv_loader.database_creator.database_for_protocol_file
@@ -180,16 +581,24 @@ class SyncHandler(BaseHTTPRequestHandler):
         csv_loader.process_csv_folder(csv_folder, protocol_json, database)
 
 
-if not os.path.exists(SyncHandler.upload_folder):
-    os.makedirs(SyncHandler.upload_folder)
+os.makedirs(SyncHandler.upload_folder, exist_ok=True)
+create_work_folders(SyncHandler.upload_folder)
+threading.Thread(target=process_jobs, name="arcpy worker", daemon=True).start()
+threading.Thread(target=clean_work_folders, name="cleaner", daemon=True).start()
 
 if Config.secure:
     # For more info on https see: https://gist.github.com/dergachev/7028596
-    server = HTTPServer(("", 8443), SyncHandler)
-    server.socket = ssl.wrap_socket(
-        server.socket, keyfile="key.pem", certfile="cert.pem", server_side=True
-    )
+    server = ThreadingHTTPServer(("", 8443), SyncHandler)
+    context = ssl.SSLContext(ssl.PROTOCOL_TLS_SERVER)
+    context.load_cert_chain(certfile="cert.pem", keyfile="key.pem")
+    # Only TLS 1.2+ with forward secret AES-GCM ciphers (TLS 1.3 suites are not
+    # affected by set_ciphers).  Session tickets are on by default, so returning
+    # clients can resume a session and skip the full key exchange.
+    context.minimum_version = ssl.TLSVersion.TLSv1_2
+    context.set_ciphers("ECDHE+AESGCM")
+    context.set_alpn_protocols(["http/1.1"])
+    server.socket = context.wrap_socket(server.socket, server_side=True)
 else:
-    server = HTTPServer(("", 8080), SyncHandler)
+    server = ThreadingHTTPServer(("", 8080), SyncHandler)
 
 server.serve_forever()